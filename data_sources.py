@@ -8,8 +8,8 @@ Provides functions to fetch:
 All functions are written for MicroPython using urequests.
 """
 
+import re
 import time
-import ujson as json
 
 try:
     import urequests as requests
@@ -19,6 +19,18 @@ except ImportError:  # allow CPython testing
 from wifi_config import OWM_API_KEY, OWM_ZIP, OWM_COUNTRY
 
 
+# HamQSL XML fields we show, matched in one pass over the response body.
+# Band conditions (typically "Poor", "Fair", "Good") are stored under their
+# short name ("band_10m" -> "10m").
+_HF_RE = re.compile(r"<(solarflux|kindex|aindex|band_10m|band_20m|band_40m)>\s*([^<]*?)\s*</")
+_HF_KEYS = {"band_10m": "10m", "band_20m": "20m", "band_40m": "40m"}
+
+# OpenWeatherMap fields we show. Pulling them out with a regex avoids
+# building the whole JSON document as dicts on the heap.
+_TEMP_RE = re.compile(r'"temp":\s*(-?[0-9.]+)')
+_DESC_RE = re.compile(r'"description":\s*"([^"]*)"')
+
+
 def fetch_weather():
     """Fetch current weather data.
 
@@ -44,16 +56,18 @@ def fetch_weather():
             print("[weather] status:", resp.status_code)
             if resp.status_code != 200:
                 return None
-            data = resp.json()
+            text = resp.text
         finally:
             resp.close()
 
-        main = data.get("main", {})
-        weather_list = data.get("weather", [])
-        desc = weather_list[0].get("description", "") if weather_list else ""
+        m = _TEMP_RE.search(text)
+        temp = float(m.group(1)) if m else None
+        # The first "description" is the primary weather condition
+        m = _DESC_RE.search(text)
+        desc = m.group(1) if m else ""
 
         result = {
-            "temp": main.get("temp"),
+            "temp": temp,
             "description": desc,
         }
         print("[weather] parsed:", result)
@@ -87,27 +101,17 @@ def fetch_hf():
         finally:
             resp.close()
 
-        def _extract(tag):
-            start_tag = "<%s>" % tag
-            end_tag = "</%s>" % tag
-            i = text.find(start_tag)
-            if i == -1:
-                return ""
-            i += len(start_tag)
-            j = text.find(end_tag, i)
-            if j == -1:
-                return ""
-            return text[i:j].strip()
-
-        result = {
-            "solarflux": _extract("solarflux"),
-            "kindex": _extract("kindex"),
-            "aindex": _extract("aindex"),
-            # Band-specific conditions from HamQSL (typically "Poor", "Fair", "Good")
-            "10m": _extract("band_10m"),
-            "20m": _extract("band_20m"),
-            "40m": _extract("band_40m"),
-        }
+        result = {}
+        m = _HF_RE.search(text)
+        while m is not None:
+            key = _HF_KEYS.get(m.group(1), m.group(1))
+            # Keep the first occurrence of each tag
+            if key not in result:
+                result[key] = m.group(2)
+            m = _HF_RE.search(text, m.end())
+        for key in ("solarflux", "kindex", "aindex", "10m", "20m", "40m"):
+            if key not in result:
+                result[key] = ""
         print("[hf] parsed:", result)
         return result
     except Exception as e:
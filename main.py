@@ -9,8 +9,12 @@ Caching ensures we keep showing the last successful values
 if a fetch fails.
 """
 
+import _thread
+import micropython
+import re
 import time
 from machine import SPI, Pin
+from micropython import const
 
 # Display driver (assumes ili9341.Display like in your slideshow project)
 from ili9341 import Display
@@ -20,13 +24,13 @@ from data_sources import fetch_weather, fetch_hf, fetch_utc_http
 
 
 # --- Display setup (adjust pins if needed) ---
-TFT_MOSI = 13
-TFT_MISO = 12
-TFT_SCLK = 14
-TFT_CS = 15
-TFT_DC = 2
-TFT_RST = -1
-TFT_BL = 21
+TFT_MOSI = const(13)
+TFT_MISO = const(12)
+TFT_SCLK = const(14)
+TFT_CS = const(15)
+TFT_DC = const(2)
+TFT_RST = const(-1)
+TFT_BL = const(21)
 
 
 def init_backlight():
@@ -43,20 +47,39 @@ def init_display():
 
 # --- Simple text drawing helpers ---
 
-WHITE = 0xFFFF
-BLACK = 0x0000
-YELLOW = 0xFFE0
-CYAN = 0x07FF
-GREEN = 0x07E0
-RED = 0xF800
+WHITE = const(0xFFFF)
+BLACK = const(0x0000)
+YELLOW = const(0xFFE0)
+CYAN = const(0x07FF)
+GREEN = const(0x07E0)
+RED = const(0xF800)
 
 # Local time offset from UTC in hours (e.g., -5 for EST, -4 for EDT)
 LOCAL_OFFSET_HOURS = -5
+_LOCAL_OFFSET_SEC = int(LOCAL_OFFSET_HOURS * 3600)
 
 # Treat the logical canvas as 320x240 (landscape). We rotate logical
 # coordinates into the physical 240x320 portrait display.
-LOGICAL_WIDTH = 320
-LOGICAL_HEIGHT = 240
+LOGICAL_WIDTH = const(320)
+LOGICAL_HEIGHT = const(240)
+
+# Text is rendered into an off-screen tile and pushed to the panel with one
+# set_window + SPI burst per line instead of one per pixel. A full 320x240
+# RGB565 framebuffer (150 KB) does not fit in ESP32 internal RAM, so the tile
+# only covers TILE_H logical rows: enough for the tallest text (scale 5).
+#
+# The tile is kept in physical (portrait) scan order so it can be streamed
+# straight into the window: each logical column is a contiguous run of
+# _tile_h pixels, and logical columns are stored right-to-left.
+TILE_H = const(40)
+_fb = bytearray(LOGICAL_WIDTH * TILE_H * 2)
+_FB_MV = memoryview(_fb)
+_tile_w = 0
+_tile_h = 0
+
+# Logical (x, y, w, h) rectangles covered by text since the last clear, so a
+# slide change only has to blank those instead of the whole screen.
+_last_dirty = []
 
 
 _FONT_5X7 = {
@@ -102,6 +125,39 @@ _FONT_5X7 = {
 }
 
 
+def _build_font():
+    # Flatten _FONT_5X7 into one bytes blob (5 column bytes per glyph) plus an
+    # ASCII code -> glyph index table, so the blitter can take a plain pointer.
+    # Lowercase letters share the uppercase glyphs, so text needs no .upper().
+    idx = bytearray(b"\xff" * 128)
+    blob = bytearray()
+    for i, ch in enumerate(_FONT_5X7):
+        code = ord(ch)
+        idx[code] = i
+        if 0x41 <= code <= 0x5A:
+            idx[code + 0x20] = i
+        blob.extend(bytes(_FONT_5X7[ch]))
+    return bytes(blob), idx
+
+
+# _GLYPH_IDX holds 0xFF for characters without a glyph
+_FONT, _GLYPH_IDX = _build_font()
+
+
+def _parse_num(value):
+    # HamQSL normally reports SFI and K as integers, so try the cheap int()
+    # first. Fractional values stay floats so the thresholds in _hf_quality()
+    # still hold (K=2.5 is FAIR, not GOOD); anything unparsable counts as 0.
+    try:
+        return int(value or 0)
+    except Exception:
+        pass
+    try:
+        return float(value)
+    except Exception:
+        return 0
+
+
 def _hf_quality(data):
     """Classify HF conditions as POOR/FAIR/GOOD based on SFI and K index.
 
@@ -110,14 +166,8 @@ def _hf_quality(data):
       - GOOD (green): K <= 2 and SFI >= 120
       - FAIR (yellow): everything in between
     """
-    try:
-        sfi = float(data.get("solarflux") or 0)
-    except Exception:
-        sfi = 0
-    try:
-        k = float(data.get("kindex") or 0)
-    except Exception:
-        k = 0
+    sfi = _parse_num(data.get("solarflux"))
+    k = _parse_num(data.get("kindex"))
 
     if k >= 5 or sfi < 80:
         return "POOR", RED
@@ -126,6 +176,43 @@ def _hf_quality(data):
     return "FAIR", YELLOW
 
 
+# Keyword classes for _weather_desc_color(), compiled once so each lookup is
+# a single regex search per class instead of a Python loop of substring tests.
+_RE_EXTREME = re.compile(
+    "|".join(
+        [
+            "thunderstorm",
+            "tornado",
+            "hurricane",
+            "blizzard",
+            "freezing",
+            "ice",
+            "sleet",
+            "storm",
+            "squall",
+        ]
+    )
+)
+_RE_WORSE = re.compile(
+    "|".join(
+        [
+            "heavy rain",
+            "rain",
+            "showers",
+            "drizzle",
+            "snow",
+            "overcast",
+            "fog",
+            "mist",
+            "haze",
+            "smoke",
+        ]
+    )
+)
+_RE_MIXED = re.compile("scattered|partly|few clouds|broken clouds")
+_RE_CLEAR = re.compile("clear|sun|fair")
+
+
 def _weather_desc_color(desc: str) -> int:
     """Map a weather description string to a color.
 
@@ -138,51 +225,33 @@ def _weather_desc_color(desc: str) -> int:
     """
     if not desc:
         return WHITE
-    d = desc.strip().lower()
+    d = desc.lower()
 
     # Extreme / severe
-    extreme_keywords = [
-        "thunderstorm",
-        "tornado",
-        "hurricane",
-        "blizzard",
-        "freezing",
-        "ice",
-        "sleet",
-        "storm",
-        "squall",
-    ]
-    if any(k in d for k in extreme_keywords):
+    if _RE_EXTREME.search(d):
         return RED
 
     # Clearly bad / worsening (use YELLOW)
-    worse_keywords = [
-        "heavy rain",
-        "rain",
-        "showers",
-        "drizzle",
-        "snow",
-        "overcast",
-        "fog",
-        "mist",
-        "haze",
-        "smoke",
-    ]
-    if any(k in d for k in worse_keywords):
+    if _RE_WORSE.search(d):
         return YELLOW
 
     # Mixed / partly cloudy / scattered clouds: treat as "worse" too
     # so they share the same YELLOW as general bad conditions.
-    if "scattered" in d or "partly" in d or "few clouds" in d or "broken clouds" in d:
+    if _RE_MIXED.search(d):
         return YELLOW
 
     # Clear / good
-    if "clear" in d or "sun" in d or "fair" in d:
+    if _RE_CLEAR.search(d):
         return GREEN
 
     return WHITE
 
 
+# Band condition prefix -> color for _hf_band_color().
+# User request: use blue for "fair"; CYAN is closest to blue in our palette.
+_BAND_COLORS = {"poor": RED, "fair": CYAN, "good": GREEN}
+
+
 def _hf_band_color(label):
     """Map a band condition string (Poor/Fair/Good) to a color.
 
@@ -195,71 +264,163 @@ def _hf_band_color(label):
     """
     if not label:
         return WHITE
-    l = label.strip().lower()
-    if l.startswith("poor"):
-        return RED
-    if l.startswith("fair"):
-        # User request: use blue for "fair"
-        return CYAN  # CYAN is closest to blue in our palette
-    if l.startswith("good"):
-        return GREEN
-    return WHITE
+    return _BAND_COLORS.get(label.strip().lower()[:4], WHITE)
 
 
-def _draw_pixel(disp, x, y, color):
-    # Bounds check in logical (landscape) coordinates
-    if x < 0 or y < 0 or x >= LOGICAL_WIDTH or y >= LOGICAL_HEIGHT:
-        return
+@micropython.viper
+def _zero_fill(buf: ptr8, n: int):
+    i = 0
+    while i < n:
+        buf[i] = 0
+        i += 1
+
 
+def _begin_tile(w, h):
+    """Start rendering a w x h logical rectangle into the off-screen tile."""
+    global _tile_w, _tile_h
+    _tile_w = w
+    _tile_h = h
+    # Clear in place; BLACK is all zero bytes
+    _zero_fill(_fb, w * h * 2)
+
+
+def flush_region(disp, x0, y0, x1, y1):
+    """Stream the tile to the logical rectangle (x0, y0)-(x1, y1), inclusive.
+
+    The rectangle must have the size passed to _begin_tile().
+    """
     # Map logical landscape (320x240) into physical portrait (240x320).
     # Rotate 90 degrees clockwise:
     #   x_phys = y_logical
     #   y_phys = (disp.height - 1) - x_logical
-    x_phys = y
-    y_phys = (disp.height - 1) - x
-
-    if x_phys < 0 or y_phys < 0 or x_phys >= disp.width or y_phys >= disp.height:
-        return
-
-    disp.set_window(x_phys, y_phys, x_phys, y_phys)
-    buf = bytearray(2)
-    buf[0] = (color >> 8) & 0xFF
-    buf[1] = color & 0xFF
+    disp.set_window(y0, disp.height - 1 - x1, y1, disp.height - 1 - x0)
+    n = (x1 - x0 + 1) * (y1 - y0 + 1) * 2
     disp.cs.value(0)
     disp.dc.value(1)
-    disp.spi.write(buf)
+    disp.spi.write(_FB_MV[:n])
     disp.cs.value(1)
 
 
-def _draw_char(disp, ch, x, y, color=WHITE, scale=1):
-    pattern = _FONT_5X7.get(ch.upper())
-    if pattern is None:
-        return 6 * scale
+# Palette colors as they sit in a buffer when stored through a ptr16: RGB565
+# goes over SPI high byte first, and the ESP32 is little-endian.
+_COLOR_WORDS = {c: ((c & 0xFF) << 8) | (c >> 8) for c in (WHITE, BLACK, YELLOW, CYAN, GREEN, RED)}
+
+
+def _color_word(color):
+    word = _COLOR_WORDS.get(color)
+    if word is None:
+        word = ((color & 0xFF) << 8) | (color >> 8)
+    return word
+
+
+@micropython.viper
+def _blit_char(fb: ptr16, font: ptr8, glyph: int, x: int, y: int, word: int, scale: int, stride: int, cols: int):
+    # glyph is the offset of the glyph's five column bytes in font (_FONT),
+    # so no per-glyph slice of the font is needed.
+    # x is the tile column of the glyph's leftmost pixel column. Tile columns
+    # run right-to-left, so pixel column n of the glyph lives at x - n. Only
+    # pixel columns n < cols are drawn, which clips glyphs at the tile's edge.
+    # Rows of one tile column are contiguous, so each run of consecutive set
+    # bits in a glyph column is filled as a single vertical span.
+    # All offsets are in pixels and stepped incrementally, so the loops do no
+    # multiplications per run or per pixel column. word comes from
+    # _color_word(), so each pixel is a single 16-bit store.
+    glyph_col_step = stride * scale
+    base = x * stride + y
+    # Pixels left before the clip edge, counted back from base
+    limit = cols * stride
     for col in range(5):
-        col_bits = pattern[col]
-        for row in range(7):
-            if col_bits & (1 << row):
-                for dx in range(scale):
-                    for dy in range(scale):
-                        _draw_pixel(disp, x + col * scale + dx, y + row * scale + dy, color)
+        span = glyph_col_step if glyph_col_step < limit else limit
+        if span <= 0:
+            break
+        bits = int(font[glyph + col])
+        top = base
+        while bits:
+            if bits & 1:
+                start = top
+                while bits & 1:
+                    bits >>= 1
+                    top += scale
+                # Fill rows [start, top) in each of the glyph column's pixel columns
+                shift = 0
+                while shift < span:
+                    off = start - shift
+                    end = top - shift
+                    while off < end:
+                        fb[off] = word
+                        off += 1
+                    shift += stride
+            else:
+                bits >>= 1
+                top += scale
+        base -= glyph_col_step
+        limit -= glyph_col_step
+
+
+@micropython.native
+def _draw_char(ch, x, y, word, scale=1):
+    # word is the glyph color from _color_word()
+    code = ord(ch)
+    idx = _GLYPH_IDX[code] if code < 128 else 0xFF
+    # The blitter only clips at the tile's right edge, so the glyph must
+    # start inside the tile and fit it vertically.
+    if idx == 0xFF or x < 0 or y < 0 or x >= _tile_w or y + 7 * scale > _tile_h:
+        return 6 * scale
+    _blit_char(_fb, _FONT, idx * 5, _tile_w - 1 - x, y, word, scale, _tile_h, _tile_w - x)
     return 6 * scale
 
 
+@micropython.native
 def draw_text(disp, text, x, y, color=WHITE, scale=1):
-    cx = x
+    h = 7 * scale
+    # The tile holds whole text lines only; skip lines that would leave the
+    # screen vertically or not fit in the tile.
+    if y < 0 or y + h > LOGICAL_HEIGHT or h > TILE_H:
+        return
+    x0 = max(x, 0)
+    x1 = min(x + len(text) * 6 * scale, LOGICAL_WIDTH)
+    if x1 <= x0:
+        return
+
+    _begin_tile(x1 - x0, h)
+    cx = x - x0
+    word = _color_word(color)
     for ch in text:
-        cx += _draw_char(disp, ch, cx, y, color=color, scale=scale)
+        cx += _draw_char(ch, cx, 0, word, scale=scale)
+    flush_region(disp, x0, y, x1 - 1, y + h - 1)
+    _mark_dirty(x0, y, x1 - x0, h)
+
+
+def _mark_dirty(x, y, w, h):
+    # Redraws inside an existing rectangle (e.g. the UTC seconds) add nothing
+    for dx, dy, dw, dh in _last_dirty:
+        if dx <= x and dy <= y and x + w <= dx + dw and y + h <= dy + dh:
+            return
+    _last_dirty.append((x, y, w, h))
 
 
 def clear_screen(disp, color=BLACK):
     disp.fill(color)
+    _last_dirty.clear()
 
 
-def draw_centered_text(disp, text, y, color=WHITE, scale=1):
+def clear_dirty(disp):
+    """Blank only the text drawn since the last clear (to BLACK)."""
+    for x, y, w, h in _last_dirty:
+        # A fresh tile is all black; text rectangles always fit in it
+        _begin_tile(w, h)
+        flush_region(disp, x, y, x + w - 1, y + h - 1)
+    _last_dirty.clear()
+
+
+def _centered_x(n_chars, scale):
     # Basic centering assuming 8x8 font per char * scale
     char_w = 8 * scale
-    x = max(0, (LOGICAL_WIDTH - len(text) * char_w) // 2)
-    draw_text(disp, text, x, y, color=color, scale=scale)
+    return max(0, (LOGICAL_WIDTH - n_chars * char_w) // 2)
+
+
+def draw_centered_text(disp, text, y, color=WHITE, scale=1):
+    draw_text(disp, text, _centered_x(len(text), scale), y, color=color, scale=scale)
 
 
 # --- Slide renderers ---
@@ -272,6 +433,16 @@ state = {
     "utc": {"ts": None, "last_sync": 0},
 }
 
+# Fetches run on a background thread (see _fetch_worker). The worker holds
+# this lock while updating a slot, and renderers take a copy of a slot under
+# it (_read_slot), so they never see data and timestamp from different fetches.
+_state_lock = _thread.allocate_lock()
+
+
+def _read_slot(name):
+    with _state_lock:
+        return dict(state[name])
+
 
 def update_weather(now):
     last = state["weather"]["last_fetch"]
@@ -280,8 +451,17 @@ def update_weather(now):
         return
     data = fetch_weather()
     if data is not None:
-        state["weather"]["data"] = data
-    state["weather"]["last_fetch"] = now
+        # Precompute what the slide shows; the data only changes every 10
+        # minutes but the slide is drawn on every rotation.
+        desc = (data.get("description", "") or "").upper()
+        temp = data.get("temp")
+        data["_desc_upper"] = desc
+        data["_color"] = _weather_desc_color(desc)
+        data["_temp_text"] = "%.0f F" % temp if temp is not None else "N/A"
+    with _state_lock:
+        if data is not None:
+            state["weather"]["data"] = data
+        state["weather"]["last_fetch"] = now
 
 
 def update_hf(now):
@@ -290,9 +470,10 @@ def update_hf(now):
     if last != 0 and (now - last) < 1800:
         return
     data = fetch_hf()
-    if data is not None:
-        state["hf"]["data"] = data
-    state["hf"]["last_fetch"] = now
+    with _state_lock:
+        if data is not None:
+            state["hf"]["data"] = data
+        state["hf"]["last_fetch"] = now
 
 
 def update_utc(now):
@@ -310,10 +491,25 @@ def update_utc(now):
         return
 
     new_ts = fetch_utc_http()
-    # Always update last_sync so we honor the backoff even on errors.
-    state["utc"]["last_sync"] = now
-    if new_ts is not None:
-        state["utc"]["ts"] = new_ts
+    with _state_lock:
+        # Always update last_sync so we honor the backoff even on errors.
+        state["utc"]["last_sync"] = now
+        if new_ts is not None:
+            state["utc"]["ts"] = new_ts
+
+
+def _fetch_worker():
+    # Runs on its own thread so slow HTTP/NTP requests never stall the
+    # display loop.
+    while True:
+        now = time.time()
+        try:
+            update_weather(now)
+            update_hf(now)
+            update_utc(now)
+        except Exception as e:
+            print("[fetch] error:", e)
+        time.sleep(1)
 
 
 def tick_utc(delta):
@@ -322,46 +518,37 @@ def tick_utc(delta):
     return
 
 
+_LOCATION_UPPER = wifi_config.LOCATION_NAME.upper()
+
+
 def draw_weather_slide(disp):
-    clear_screen(disp)
-    data = state["weather"]["data"]
+    clear_dirty(disp)
+    data = _read_slot("weather")["data"]
     if data is None:
         draw_centered_text(disp, "WEATHER LOADING...", 120, color=YELLOW, scale=3)
         return
 
-    temp = data.get("temp")
-    desc = data.get("description", "") or ""
-    # MicroPython strings don't support .title(); do a simple first-letter upper
-    if desc:
-        desc = desc[0].upper() + desc[1:]
-
-    # Use uppercase for description for better readability
-    desc = desc.upper()
-
     # Top: location
-    draw_centered_text(disp, wifi_config.LOCATION_NAME.upper(), 20, color=CYAN, scale=2)
+    draw_centered_text(disp, _LOCATION_UPPER, 20, color=CYAN, scale=2)
 
     # Middle: large temperature
-    if temp is not None:
-        text = "%.0f F" % temp
-    else:
-        text = "N/A"
-    draw_centered_text(disp, text, 100, color=WHITE, scale=5)
+    draw_centered_text(disp, data["_temp_text"], 100, color=WHITE, scale=5)
 
-    # Bottom: description with color based on severity/condition
-    color = _weather_desc_color(desc)
-    draw_centered_text(disp, desc, 180, color=color, scale=2)
+    # Bottom: uppercase description with color based on severity/condition
+    # (both precomputed in update_weather)
+    draw_centered_text(disp, data["_desc_upper"], 180, color=data["_color"], scale=2)
 
 
 def draw_hf_slide(disp):
-    clear_screen(disp)
-    data = state["hf"]["data"]
+    clear_dirty(disp)
+    hf = _read_slot("hf")
+    data = hf["data"]
     draw_centered_text(disp, "HF CONDITIONS", 20, color=CYAN, scale=2)
 
     if data is None:
         # If we've already attempted a fetch (last_fetch != 0) but still have no data,
         # show a clearer message that HF data is unavailable.
-        if state["hf"]["last_fetch"]:
+        if hf["last_fetch"]:
             draw_centered_text(disp, "HF UNAVAILABLE", 120, color=YELLOW, scale=3)
         else:
             draw_centered_text(disp, "HF LOADING...", 120, color=YELLOW, scale=3)
@@ -393,46 +580,100 @@ def draw_hf_slide(disp):
     draw_text(disp, "40M", 240, y, color=color_40, scale=3)
 
 
-def draw_utc_slide(disp):
-    clear_screen(disp)
-    draw_centered_text(disp, "UTC / LOCAL", 10, color=CYAN, scale=2)
+# The UTC slide is refreshed every second while it is shown, but only the
+# seconds change between minutes. Everything else is formatted once per
+# minute and cached here. This assumes the local offset is a whole number of
+# minutes, so local seconds always equal UTC seconds.
+_utc_cache = {"epoch_minute": -1, "utc_hhmm": "", "local_hhmm": "", "date": ""}
 
-    # If we've never successfully synced, show a syncing message.
-    if state["utc"]["ts"] is None:
-        draw_centered_text(disp, "SYNCING...", 120, color=YELLOW, scale=3)
-        return
+# Layout of the UTC slide. Both clock lines are centered and read
+# <prefix>HH:MM:SS; the *_SS_X values are where their seconds digits start.
+_LOCAL_PREFIX = "LOCAL "
+_HHMM_LEN = len("HH:MM:")
+
+
+def _ss_x(prefix, scale):
+    n = len(prefix) + _HHMM_LEN
+    return _centered_x(n + len("SS"), scale) + n * 6 * scale
+
+
+_UTC_TIME_Y = const(60)
+_UTC_SS_X = _ss_x("", 4)
+_LOCAL_TIME_Y = const(170)
+_LOCAL_SS_X = _ss_x(_LOCAL_PREFIX, 3)
 
-    # Read current UTC from RTC
-    t_utc = time.gmtime()
-    utc_hh = t_utc[3]
-    utc_mm = t_utc[4]
-    utc_ss = t_utc[5]
-    utc_time_str = "%02d:%02d:%02d" % (utc_hh, utc_mm, utc_ss)
-    utc_date_str = "%04d-%02d-%02d" % (t_utc[0], t_utc[1], t_utc[2])
+
+def _update_utc_cache(ts):
+    """Reformat the per-minute UTC/local strings; returns True if they changed."""
+    minute = ts // 60
+    c = _utc_cache
+    if minute == c["epoch_minute"]:
+        return False
+
+    t_utc = time.gmtime(ts)
+    c["utc_hhmm"] = "%02d:%02d:" % (t_utc[3], t_utc[4])
+    c["date"] = "%04d-%02d-%02d" % (t_utc[0], t_utc[1], t_utc[2])
 
     # Compute local time using a fixed offset from UTC
     try:
-        offset_sec = int(LOCAL_OFFSET_HOURS * 3600)
-        t_local = time.gmtime(time.time() + offset_sec)
-        loc_hh = t_local[3]
-        loc_mm = t_local[4]
-        loc_ss = t_local[5]
-        local_time_str = "%02d:%02d:%02d" % (loc_hh, loc_mm, loc_ss)
+        t_local = time.gmtime(ts + _LOCAL_OFFSET_SEC)
+        c["local_hhmm"] = "%02d:%02d:" % (t_local[3], t_local[4])
     except Exception:
-        local_time_str = "--:--:--"
+        c["local_hhmm"] = "--:--:"
+
+    c["epoch_minute"] = minute
+    return True
+
+
+def _draw_utc_times(disp, ts, full):
+    c = _utc_cache
+    ss = "%02d" % (ts % 60)
+    if not full:
+        draw_text(disp, ss, _UTC_SS_X, _UTC_TIME_Y, color=WHITE, scale=4)
+        draw_text(disp, ss, _LOCAL_SS_X, _LOCAL_TIME_Y, color=WHITE, scale=3)
+        return
 
     # UTC time large, date smaller below
-    draw_centered_text(disp, utc_time_str, 60, color=WHITE, scale=4)
-    draw_centered_text(disp, utc_date_str, 110, color=GREEN, scale=2)
+    draw_centered_text(disp, c["utc_hhmm"] + ss, _UTC_TIME_Y, color=WHITE, scale=4)
+    draw_centered_text(disp, c["date"], 110, color=GREEN, scale=2)
 
     # Local time at the bottom
-    draw_centered_text(disp, "LOCAL %s" % local_time_str, 170, color=WHITE, scale=3)
+    draw_centered_text(disp, _LOCAL_PREFIX + c["local_hhmm"] + ss, _LOCAL_TIME_Y, color=WHITE, scale=3)
+
+
+def draw_utc_slide(disp):
+    clear_dirty(disp)
+    draw_centered_text(disp, "UTC / LOCAL", 10, color=CYAN, scale=2)
+
+    # If we've never successfully synced, show a syncing message.
+    if _read_slot("utc")["ts"] is None:
+        # Force a full redraw from refresh_utc_slide() once we have a time
+        _utc_cache["epoch_minute"] = -1
+        draw_centered_text(disp, "SYNCING...", 120, color=YELLOW, scale=3)
+        return
+
+    # Read current UTC from RTC
+    ts = time.time()
+    _update_utc_cache(ts)
+    _draw_utc_times(disp, ts, True)
+
+
+def refresh_utc_slide(disp):
+    """Tick the clock on an already drawn UTC slide."""
+    if _read_slot("utc")["ts"] is None:
+        return
+    if _utc_cache["epoch_minute"] < 0:
+        # The slide still shows the syncing message
+        draw_utc_slide(disp)
+        return
+    ts = time.time()
+    _draw_utc_times(disp, ts, _update_utc_cache(ts))
 
 
 # --- Main loop ---
 
 SLIDES = ["weather", "hf", "utc"]
-SLIDE_DURATION = 10  # seconds
+SLIDE_DURATION = const(10)  # seconds
 
 
 def connect_wifi():
@@ -463,20 +704,21 @@ def main():
 
     connect_wifi()
 
+    # TLS handshakes need more than the default thread stack
+    _thread.stack_size(16 * 1024)
+    _thread.start_new_thread(_fetch_worker, ())
+
     current_index = 0
     last_slide_change = time.time()
+    last_tick = last_slide_change
 
-    # Initial draw
+    # Initial draw; later slide changes only clear what the previous slide drew
+    clear_screen(disp)
     draw_weather_slide(disp)
 
     while True:
         now = time.time()
 
-        # Data refresh
-        update_weather(now)
-        update_hf(now)
-        update_utc(now)
-
         # Slide change
         if now - last_slide_change >= SLIDE_DURATION:
             current_index = (current_index + 1) % len(SLIDES)
@@ -490,6 +732,10 @@ def main():
                 draw_utc_slide(disp)
 
             last_slide_change = now
+        elif now != last_tick and SLIDES[current_index] == "utc":
+            # Keep the clock running while the UTC slide is shown
+            refresh_utc_slide(disp)
+        last_tick = now
 
         time.sleep(0.2)
 
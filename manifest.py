@@ -0,0 +1,12 @@
+# Freeze manifest for building a custom MicroPython firmware that includes
+# the display code as precompiled bytecode. From a MicroPython checkout:
+#
+#   make -C ports/esp32 BOARD=ESP32_GENERIC FROZEN_MANIFEST=/path/to/esp32-rotating-display/manifest.py
+#
+# wifi_config.py and ili9341.py stay on the device filesystem so settings can
+# be changed without rebuilding the firmware.
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+module("main.py", opt=3)
+module("data_sources.py", opt=3)